@@ -11,78 +11,94 @@ GitHub: https://github.com/pradumon14
 import hashlib
 import getpass
 import argparse
+import functools
+import itertools
+import re
+import shutil
 import string
 import sys
 import subprocess
 
 # --- Rich Library Import and Fallback ---
-# Attempts to import the 'rich' library for enhanced terminal UI.
-# If 'rich' is not available, it falls back to basic print statements.
+# The 'rich' library is used for enhanced terminal UI, but importing it is slow,
+# so it is only loaded by _init_ui() when the CLI actually starts. Until then (and
+# whenever 'rich' is not available) the script uses basic print-based fallbacks,
+# which keeps importing this module as a library cheap.
 RICH_AVAILABLE = False
-try:
-    from rich.console import Console
-    from rich.panel import Panel
-    from rich.rule import Rule
-    from rich.prompt import Prompt as RichPrompt
-    from rich.text import Text as RichText
-    from rich.box import MINIMAL
-    RICH_AVAILABLE = True
-except ImportError:
-    pass # rich not available, proceed with fallbacks
-
-# Define fallback classes if rich is not available
-if not RICH_AVAILABLE:
-    class FallbackConsole:
-        """A simple console fallback when rich is not installed."""
-        def print(self, *args, **kwargs):
-            text = " ".join(str(arg) for arg in args)
-            # Strip rich markup for plain output
-            text = text.replace("[bold yellow]", "").replace("[/bold yellow]", "") \
-                       .replace("[bold green]", "").replace("[/bold green]", "") \
-                       .replace("[bold blue]", "").replace("[/bold blue]", "") \
-                       .replace("[dim]", "").replace("[/dim]", "") \
-                       .replace("[bold red]", "").replace("[/bold red]", "") \
-                       .replace("[bold magenta]", "").replace("[/bold magenta]", "") \
-                       .replace("[cyan]", "").replace("[/cyan]", "") \
-                       .replace("[bold orange3]", "").replace("[/bold orange3]", "") \
-                       .replace("[green]", "").replace("[/green]", "") \
-                       .replace("[bold green_yellow]", "").replace("[/bold green_yellow]", "") \
-                       .replace("[yellow]", "").replace("[/yellow]", "") \
-                       .replace("[on black]", "")
-            file_arg = kwargs.pop('file', sys.stdout) # Handle 'file' argument for compatibility
-            print(text, file=file_arg, **kwargs)
-
-        def rule(self, *args, **kwargs):
-            print("-" * 50) # Simple rule for fallback
-        def panel(self, content, *args, **kwargs):
-            title = kwargs.get('title', '')
-            if title:
-                print(f"\n--- {title} ---\n{content}\n------------------\n")
-            else:
-                print(f"\n{content}\n------------------\n")
-
-    class FallbackPrompt:
-        """A simple prompt fallback when rich is not installed."""
-        def ask(self, prompt_text, **kwargs):
-            return input(f"{str(prompt_text)}: ")
 
-    class FallbackText(str):
-        """A simple text fallback when rich is not installed."""
-        def __new__(cls, text, style=None):
-            return str.__new__(cls, text)
-        def __init__(self, text, style=None):
-            self.plain = text # Store plain text for compatibility
-
-# Instantiate console, Prompt, and Text objects based on rich availability
-console = Console() if RICH_AVAILABLE else FallbackConsole()
-Prompt = RichPrompt if RICH_AVAILABLE else FallbackPrompt()
-Text = RichText if RICH_AVAILABLE else FallbackText
+# Matches the rich style tags used throughout this script (e.g. "[bold red]", "[/dim]"),
+# so the fallback console can strip all markup in a single pass.
+_RICH_MARKUP_RE = re.compile(
+    r"\[/?(?:bold|dim|on black|(?:bold )?(?:red|orange3|yellow|green|green_yellow|blue|magenta|cyan))\]"
+)
+
+class FallbackConsole:
+    """A simple console fallback when rich is not installed."""
+    def __init__(self, file=None):
+        self.file = file # Default output stream; None means sys.stdout at print time
+
+    def print(self, *args, **kwargs):
+        # Strip rich markup for plain output
+        text = _RICH_MARKUP_RE.sub("", " ".join(str(arg) for arg in args))
+        file_arg = kwargs.pop('file', self.file or sys.stdout) # Handle 'file' argument for compatibility
+        print(text, file=file_arg, **kwargs)
+
+    def rule(self, *args, **kwargs):
+        print("-" * 50) # Simple rule for fallback
+    def panel(self, content, *args, **kwargs):
+        title = kwargs.get('title', '')
+        if title:
+            print(f"\n--- {title} ---\n{content}\n------------------\n")
+        else:
+            print(f"\n{content}\n------------------\n")
+
+class FallbackPrompt:
+    """A simple prompt fallback when rich is not installed."""
+    def ask(self, prompt_text, **kwargs):
+        return input(f"{str(prompt_text)}: ")
+
+class FallbackText(str):
+    """A simple text fallback when rich is not installed."""
+    def __new__(cls, text, style=None):
+        return str.__new__(cls, text)
+    def __init__(self, text, style=None):
+        self.plain = text # Store plain text for compatibility
+
+# Console, Prompt, and Text objects start as fallbacks; _init_ui() swaps in rich.
+console = FallbackConsole()
+Prompt = FallbackPrompt()
+Text = FallbackText
+Panel = None
+Rule = None
+MINIMAL = None
+
+def _init_ui():
+    """
+    Imports 'rich' and installs its console, prompt and renderables as the
+    module-level UI objects. Warns and keeps the fallbacks if 'rich' is missing.
+    """
+    global RICH_AVAILABLE, console, Prompt, Text, Panel, Rule, MINIMAL
+    try:
+        from rich.console import Console
+        from rich.panel import Panel as RichPanel
+        from rich.rule import Rule as RichRule
+        from rich.prompt import Prompt as RichPrompt
+        from rich.text import Text as RichText
+        from rich.box import MINIMAL as RICH_MINIMAL
+    except ImportError:
+        # Warn user if rich is not available
+        console.print("\n[bold yellow]Warning: 'rich' library not found.[/bold yellow]")
+        console.print("[bold yellow]Falling back to basic terminal output. For a better experience, install it:[/bold yellow]")
+        console.print("[bold cyan]pip install rich[/bold cyan]\n")
+        return
 
-# Warn user if rich is not available
-if not RICH_AVAILABLE:
-    console.print("\n[bold yellow]Warning: 'rich' library not found.[/bold yellow]")
-    console.print("[bold yellow]Falling back to basic terminal output. For a better experience, install it:[/bold yellow]")
-    console.print("[bold cyan]pip install rich[/bold cyan]\n")
+    RICH_AVAILABLE = True
+    console = Console()
+    Prompt = RichPrompt
+    Text = RichText
+    Panel = RichPanel
+    Rule = RichRule
+    MINIMAL = RICH_MINIMAL
 
 
 # --- Global Character Sets ---
@@ -92,6 +108,87 @@ LOWERCASE_BASE = string.ascii_lowercase
 UPPERCASE_BASE = string.ascii_uppercase
 NUMBERS_BASE = string.digits
 
+_NO_CHAR_TYPES_MSG = "No character types are enabled or available for password generation. Please enable at least one type."
+
+# Hash algorithms accepted by generate_monkey_password (see _derive_hash_material).
+HASH_ALGORITHMS = ("sha256", "shake256")
+
+# Frozen lookups for per-character membership tests (O(1) instead of a string scan).
+_PUNCT_SET = frozenset(string.punctuation)
+
+# Character-class bits used by the single-pass classification below.
+_CLASS_UPPER = 1 << 0
+_CLASS_LOWER = 1 << 1
+_CLASS_DIGIT = 1 << 2
+_CLASS_SYMBOL = 1 << 3
+
+# Class bit that marks each base character set as present in a password.
+_BASE_SET_CLASSES = {UPPERCASE_BASE: _CLASS_UPPER, LOWERCASE_BASE: _CLASS_LOWER, NUMBERS_BASE: _CLASS_DIGIT}
+
+def _classify(ch: str) -> int:
+    """Returns the character-class bitmask for a single character."""
+    mask = 0
+    if ch.isupper(): mask |= _CLASS_UPPER
+    if ch.islower(): mask |= _CLASS_LOWER
+    if ch.isdigit(): mask |= _CLASS_DIGIT
+    if ch in _PUNCT_SET: mask |= _CLASS_SYMBOL
+    return mask
+
+# Byte -> class bitmask table for ASCII input (bytes >= 128 map to 0).
+# Sized to 256 entries so it can be used directly with bytes.translate().
+_CLASS_TABLE = bytes(_classify(chr(b)) if b < 128 else 0 for b in range(256))
+
+# Matches any character repeated four (or more) times in a row, e.g. "aaaa".
+_REPEAT_RE = re.compile(r"(.)\1{3}", re.DOTALL)
+
+# Maximum number of leading characters inspected by estimate_password_strength.
+_STRENGTH_SAMPLE_LEN = 100
+
+def _ascii_class_mask(data: bytes) -> int:
+    """Computes the OR of the class bits of every byte in `data` at C level."""
+    mask = 0
+    for bits in set(data.translate(_CLASS_TABLE)):
+        mask |= bits
+    return mask
+
+def _class_mask(text: str) -> int:
+    """
+    Computes the OR of the class bits of every character in `text` in one pass.
+    ASCII input is classified at C level via the lookup table; any other input
+    falls back to per-character classification.
+    """
+    if text.isascii():
+        return _ascii_class_mask(text.encode("ascii"))
+    mask = 0
+    for ch in set(text):
+        mask |= _classify(ch)
+    return mask
+
+def _resolve_clip_cmd() -> tuple[str, ...]:
+    """
+    Resolves the platform-specific clipboard command once.
+
+    Returns:
+        tuple[str, ...]: The clipboard command's argv, or an empty tuple if no
+            supported clipboard utility is available on this system.
+    """
+    if sys.platform == "darwin": # macOS
+        return ("pbcopy",)
+    if sys.platform == "win32": # Windows
+        return ("clip",)
+    if sys.platform.startswith("linux"): # Linux
+        # Prefer xclip, then xsel
+        if shutil.which("xclip"):
+            return ("xclip", "-selection", "clipboard")
+        if shutil.which("xsel"):
+            return ("xsel", "-b")
+    return ()
+
+# Clipboard command resolved at import time, so each copy is a single process spawn.
+_CLIP_CMD = _resolve_clip_cmd()
+_CLIP_NOT_FOUND_MSG = ("[bold red]Clipboard utility not found. Please install 'xclip' or 'xsel' on Linux, "
+                       "or ensure 'pbcopy' (macOS) / 'clip' (Windows) are available.[/bold red]")
+
 def copy_to_clipboard(text: str) -> bool:
     """
     Copies the given text to the system clipboard using platform-specific commands.
@@ -102,23 +199,17 @@ def copy_to_clipboard(text: str) -> bool:
     Returns:
         bool: True if the copy operation was successful, False otherwise.
     """
-    try:
-        if sys.platform == "darwin": # macOS
-            subprocess.run("pbcopy", text=text, check=True, input=text)
-        elif sys.platform == "win32": # Windows
-            subprocess.run("clip", text=text, check=True, input=text)
-        elif sys.platform.startswith("linux"): # Linux
-            # Try xclip first, then xsel
-            try:
-                subprocess.run(["xclip", "-selection", "clipboard"], text=text, check=True, input=text)
-            except FileNotFoundError:
-                subprocess.run(["xsel", "-b"], text=text, check=True, input=text)
+    if not _CLIP_CMD:
+        if sys.platform.startswith("linux"):
+            console.print(_CLIP_NOT_FOUND_MSG)
         else:
             console.print("[bold red]Clipboard copying not supported on this OS.[/bold red]")
-            return False
+        return False
+    try:
+        subprocess.run(_CLIP_CMD, input=text, text=True, check=True)
         return True
     except FileNotFoundError:
-        console.print("[bold red]Clipboard utility not found. Please install 'xclip' or 'xsel' on Linux, or ensure 'pbcopy' (macOS) / 'clip' (Windows) are available.[/bold red]")
+        console.print(_CLIP_NOT_FOUND_MSG)
         return False
     except subprocess.CalledProcessError as e:
         console.print(f"[bold red]Failed to copy to clipboard: {e}[/bold red]")
@@ -145,6 +236,9 @@ def estimate_password_strength(password: str) -> tuple[str, str, list[str]]:
     feedback = []
 
     length = len(password)
+    # Character-type and repetition signals saturate quickly, so only a bounded
+    # prefix is scanned; the full length still counts towards the length score.
+    sample = password[:_STRENGTH_SAMPLE_LEN]
     if length < 8:
         feedback.append("[red]Very short password.[/red]")
     elif length < 12:
@@ -154,16 +248,8 @@ def estimate_password_strength(password: str) -> tuple[str, str, list[str]]:
         strength_score += 2
         feedback.append("[green]Excellent length![/green]")
 
-    has_upper = any(c.isupper() for c in password)
-    has_lower = any(c.islower() for c in password)
-    has_digit = any(c.isdigit() for c in password)
-    has_symbol = any(c in string.punctuation for c in password)
-
-    char_types = 0
-    if has_upper: char_types += 1
-    if has_lower: char_types += 1
-    if has_digit: char_types += 1
-    if has_symbol: char_types += 1
+    # Classify all characters in a single pass; each set bit is one character type.
+    char_types = bin(_class_mask(sample)).count("1")
 
     if char_types < 2:
         feedback.append("[red]Lacks character diversity (try mixing types).[/red]")
@@ -178,12 +264,9 @@ def estimate_password_strength(password: str) -> tuple[str, str, list[str]]:
         feedback.append("[green]Excellent character diversity![/green]")
 
     # Very basic check for repeating characters (e.g., "aaaa")
-    if length > 3:
-        for i in range(length - 3):
-            if password[i] == password[i+1] == password[i+2] == password[i+3]:
-                feedback.append("[red]Avoid repeating characters (e.g., 'aaaa').[/red]")
-                strength_score -= 1
-                break
+    if _REPEAT_RE.search(sample):
+        feedback.append("[red]Avoid repeating characters (e.g., 'aaaa').[/red]")
+        strength_score -= 1
 
     # Determine overall strength level and corresponding color
     strength_level = ""
@@ -206,33 +289,80 @@ def estimate_password_strength(password: str) -> tuple[str, str, list[str]]:
 
     return strength_level, strength_color, feedback
 
-def generate_monkey_password(simple_password: str, unique_key: str, desired_length: int,
-                             include_upper: bool, include_lower: bool, include_numbers: bool, include_symbols: bool,
-                             custom_symbols_set: str, verbose: bool) -> str:
+def _derive_hash_material(data: bytes, needed_bytes: int, hash_algorithm: str) -> bytes:
     """
-    Generates a complex, secure password based on the "Monkey" algorithm.
+    Derives exactly `needed_bytes` of hash output from `data`.
 
-    The algorithm is entirely deterministic: the same inputs will always
-    produce the same output. No true randomness is involved.
+    Args:
+        data (bytes): The combined input to hash.
+        needed_bytes (int): Number of bytes the generation passes will consume.
+        hash_algorithm (str): "sha256" repeats the 32-byte SHA-256 digest as often
+            as needed (the original algorithm); "shake256" reads a single SHAKE-256
+            stream of the required length, so long passwords never reuse material.
+
+    Returns:
+        bytes: The hash material.
+
+    Raises:
+        ValueError: If `hash_algorithm` is not one of HASH_ALGORITHMS.
+    """
+    if hash_algorithm == "sha256":
+        digest = hashlib.sha256(data).digest()
+        return (digest * (needed_bytes // len(digest) + 1))[:needed_bytes]
+    if hash_algorithm == "shake256":
+        return hashlib.shake_256(data).digest(needed_bytes)
+    raise ValueError(f"Unsupported hash algorithm '{hash_algorithm}'. Choose one of: {', '.join(HASH_ALGORITHMS)}.")
+
+def _hash_nibble(material: bytes, k: int) -> int:
+    """Returns the k-th hex digit (0-15) of `material`, high nibble first."""
+    byte = material[k >> 1]
+    return byte & 0xF if k & 1 else byte >> 4
+
+@functools.lru_cache(maxsize=16)
+def _build_choice_table(char_sets: tuple):
+    """
+    Builds the Pass 1 lookup table for a given tuple of active character sets.
+
+    Pass 1 picks each character from two hash nibbles: the decision nibble `d`
+    selects the set (`d % len(char_sets)`) and the selection nibble `c` selects
+    the character within it. The table maps the combined byte `(d << 4) | c`
+    straight to that character, so each position needs a single lookup.
+
+    The table has the same type as the sets: bytes for ASCII sets, or a
+    256-character str when the sets contain non-ASCII symbols.
+    """
+    ascii_sets = isinstance(char_sets[0], bytes)
+    table = bytearray(256) if ascii_sets else [''] * 256
+    for d in range(16):
+        target_char_set = char_sets[d % len(char_sets)]
+        for c in range(16):
+            table[(d << 4) | c] = target_char_set[c % len(target_char_set)]
+    return bytes(table) if ascii_sets else "".join(table)
+
+def build_char_sets(include_upper: bool, include_lower: bool, include_numbers: bool, include_symbols: bool,
+                    custom_symbols_set: str = None) -> tuple:
+    """
+    Builds the active character sets for generate_monkey_password.
+
+    The result only depends on the include/exclude options, so it can be built
+    once and reused for every password generated with the same options.
 
     Args:
-        simple_password (str): A user-provided simple password/phrase.
-        unique_key (str): A user-provided unique key (e.g., website name, email).
-        desired_length (int): The required length of the generated password.
         include_upper (bool): True if uppercase letters should be included.
         include_lower (bool): True if lowercase letters should be included.
         include_numbers (bool): True if numbers should be included.
         include_symbols (bool): True if symbols should be included.
         custom_symbols_set (str): User-defined set of symbols to use.
-        verbose (bool): True to print intermediate hash for debugging/understanding.
 
     Returns:
-        str: The deterministically generated complex password.
+        tuple: The enabled character sets in the order uppercase, lowercase, numbers,
+            symbols. They are ASCII bytes, so the password can be assembled in a
+            bytearray; if the custom symbols contain non-ASCII characters, all sets
+            are kept as str instead, which produces the same passwords.
 
     Raises:
         ValueError: If no character types are enabled for generation.
     """
-
     symbols_to_use = custom_symbols_set if custom_symbols_set else SYMBOLS_DEFAULT
 
     # Create active character sets based on user's include/exclude choices.
@@ -248,109 +378,199 @@ def generate_monkey_password(simple_password: str, unique_key: str, desired_leng
 
     # Validate that at least one character type is selected.
     if not active_char_sets:
-        raise ValueError("No character types are enabled or available for password generation. Please enable at least one type.")
+        raise ValueError(_NO_CHAR_TYPES_MSG)
+    # Non-ASCII custom symbols cannot live in a byte buffer; keep those sets as str.
+    if not all(s.isascii() for s in active_char_sets):
+        return tuple(active_char_sets)
+    return tuple(s.encode("ascii") for s in active_char_sets)
+
+def generate_monkey_password(simple_password: str, unique_key: str, desired_length: int,
+                             active_char_sets: tuple, verbose: bool,
+                             hash_algorithm: str = "sha256") -> str:
+    """
+    Generates a complex, secure password based on the "Monkey" algorithm.
+
+    The algorithm is entirely deterministic: the same inputs will always
+    produce the same output. No true randomness is involved.
+
+    Args:
+        simple_password (str): A user-provided simple password/phrase.
+        unique_key (str): A user-provided unique key (e.g., website name, email).
+        desired_length (int): The required length of the generated password.
+        active_char_sets (tuple): The enabled character sets, as built by
+            build_char_sets(). Every set is guaranteed to appear in the result.
+        verbose (bool): True to print intermediate hash for debugging/understanding.
+        hash_algorithm (str): Hash used to derive the password, "sha256" (default)
+            or "shake256". "shake256" selects sets and characters with full hash
+            bytes rather than hex digits, so it produces different passwords.
+
+    Returns:
+        str: The deterministically generated complex password.
+
+    Raises:
+        ValueError: If no character types are enabled for generation.
+        ValueError: If `hash_algorithm` is not supported.
+    """
+    if not active_char_sets:
+        raise ValueError(_NO_CHAR_TYPES_MSG)
+    # ASCII sets are assembled in a bytearray; non-ASCII sets use a list of characters.
+    ascii_sets = isinstance(active_char_sets[0], bytes)
 
     # --- 1. Input Combination ---
     combined_input = simple_password + str(unique_key)
 
-    # --- 2. SHA-256 Hashing ---
-    # Compute the SHA-256 hash of the combined input.
-    # SHA-256 produces a 64-character hexadecimal string.
-    base_hash = hashlib.sha256(combined_input.encode()).hexdigest()
+    # --- 2. Hashing ---
+    # Derive all the hash material the two passes need in one go. SHA-256 (the
+    # original algorithm) reads one byte (two hex digits) per password character
+    # and per diversity injection, repeating the 32-byte digest as needed.
+    # SHAKE-256 reads a full byte for every decision instead, i.e. two bytes per
+    # character and per injection, so every character of a set can be selected.
+    decision_pairs = desired_length + len(active_char_sets)
+    needed_bytes = decision_pairs if hash_algorithm == "sha256" else 2 * decision_pairs
+    hash_material = _derive_hash_material(combined_input.encode(), needed_bytes, hash_algorithm)
 
     if verbose:
         console.print(f"  [dim]Combined input (truncated): '{combined_input[:10]}...{combined_input[-10:]}'[/dim]")
-        console.print(f"  [dim]SHA-256 Hash: {base_hash}[/dim]")
-
-    # --- 3. Length Adjustment & Initial Character Pool ---
-    # Ensure extended_hash is long enough for all character selections and diversity injections.
-    # We need at least 2 hex chars per password char for Pass 1, plus 2 hex chars per diversity injection for Pass 2.
-    min_hash_needed = desired_length * 2 + len(active_char_sets) * 2
-    # Extend the base hash sufficiently to cover all generation needs, plus a buffer.
-    extended_hash = (base_hash * ((min_hash_needed // len(base_hash)) + 2))[:min_hash_needed + 10]
-
-    # Initialize the list of password characters.
-    transformed_password_chars = [''] * desired_length
-
-    # --- 4. Advanced Deterministic Transformation (Pass 1) ---
-    # Iterates through each position, deterministically selecting a character type
-    # and a character from that type based on the SHA-256 hash.
-    hash_read_idx = 0
-
-    for i in range(desired_length):
-        # Dynamically extend hash if we are running out of deterministic values
-        if hash_read_idx + 1 >= len(extended_hash):
-            extended_hash += base_hash.repeat(2)
-            if verbose:
-                console.print("[dim]  Dynamically extended hash for more deterministic values.[/dim]")
-
-        # Get a "decision value" (0-15) from the hash to pick a character set.
-        decision_val = int(extended_hash[hash_read_idx], 16)
-        hash_read_idx += 1
-
-        # Deterministically select a character set from the active ones.
-        target_char_set = active_char_sets[decision_val % len(active_char_sets)]
-
-        # Get a "character selection value" (0-15) from the hash to pick a character within the set.
-        if hash_read_idx + 1 >= len(extended_hash):
-            extended_hash += base_hash.repeat(2) # Re-extend if needed
-        char_select_val = int(extended_hash[hash_read_idx], 16)
-        hash_read_idx += 1
-
-        # Pick the character and assign it.
-        if target_char_set: # Ensure target_char_set is not empty
-            transformed_password_chars[i] = target_char_set[char_select_val % len(target_char_set)]
+        if hash_algorithm == "sha256":
+            console.print(f"  [dim]SHA-256 Hash: {hashlib.sha256(combined_input.encode()).hexdigest()}[/dim]")
         else:
-            # Fallback if a chosen set is empty (should be rare due to initial checks)
-            fallback_set = next((s for s in active_char_sets if s), None)
-            if fallback_set:
-                transformed_password_chars[i] = fallback_set[char_select_val % len(fallback_set)]
-            else:
-                transformed_password_chars[i] = '?' # Critical fallback, indicates a problem
-
-    # --- 5. Guaranteed Diversity (Pass 2) ---
+            console.print(f"  [dim]SHAKE-256 Output: {hash_material.hex()}[/dim]")
+
+    # --- 3. Advanced Deterministic Transformation (Pass 1) ---
+    if hash_algorithm == "sha256":
+        # Each hash byte holds a "decision value" (high nibble, 0-15) that picks the
+        # character set and a "character selection value" (low nibble, 0-15) that picks
+        # the character within it. The choice table resolves both at once, so the whole
+        # pass is a single C-level translate (active sets are never empty, see above).
+        # Non-ASCII sets use a str table and a list of characters instead.
+        choice_table = _build_choice_table(active_char_sets)
+        if ascii_sets:
+            password_buf = bytearray(hash_material[:desired_length].translate(choice_table))
+        else:
+            password_buf = list(map(choice_table.__getitem__, hash_material[:desired_length]))
+    else:
+        # One full byte (0-255) picks the character set and the next one picks the
+        # character within it. The set count and lengths are loop invariants.
+        n_sets = len(active_char_sets)
+        set_lens = tuple(map(len, active_char_sets))
+        chars = []
+        for i in range(0, 2 * desired_length, 2):
+            set_idx = hash_material[i] % n_sets
+            chars.append(active_char_sets[set_idx][hash_material[i + 1] % set_lens[set_idx]])
+        password_buf = bytearray(chars) if ascii_sets else chars
+
+    # --- 4. Guaranteed Diversity (Pass 2) ---
     # After initial transformations, ensures the password contains at least one
     # of each *required* character type to meet common password policies.
-    current_password_string = "".join(transformed_password_chars)
-
-    categories_to_ensure = []
-    # Check if each *enabled* category is present. If not, add to categories_to_ensure.
-    if include_upper and not any(c.isupper() for c in current_password_string) and UPPERCASE_BASE:
-        categories_to_ensure.append(UPPERCASE_BASE)
-    if include_lower and not any(c.islower() for c in current_password_string) and LOWERCASE_BASE:
-        categories_to_ensure.append(LOWERCASE_BASE)
-    if include_numbers and not any(c.isdigit() for c in current_password_string) and NUMBERS_BASE:
-        categories_to_ensure.append(NUMBERS_BASE)
-    # Check for symbols using the actual symbols_to_use, not just string.punctuation
-    if include_symbols and not any(c in symbols_to_use for c in current_password_string) and symbols_to_use:
-         categories_to_ensure.append(symbols_to_use)
-
-    guarantee_hash_idx = hash_read_idx # Continue consuming hash from where Pass 1 left off
+    # Collect the characters present once; a set is missing if it shares none of them.
+    present_chars = frozenset(password_buf)
+    if ascii_sets:
+        categories_to_ensure = [char_set for char_set in active_char_sets if present_chars.isdisjoint(char_set)]
+    else:
+        # Non-ASCII symbols can themselves be letters or digits (e.g. 'Ω', '²'). They
+        # count towards those types, so the base sets are checked by character class.
+        present_mask = _class_mask("".join(password_buf))
+        categories_to_ensure = [char_set for char_set in active_char_sets
+                                if not present_mask & _BASE_SET_CLASSES.get(char_set, 0)
+                                and present_chars.isdisjoint(char_set)]
+
+    # Continue consuming the hash material from where Pass 1 left off: hex digits
+    # (two per position) for SHA-256, whole bytes (two per position) for SHAKE-256.
+    if hash_algorithm == "sha256":
+        hash_values = (_hash_nibble(hash_material, k) for k in itertools.count(2 * desired_length))
+    else:
+        hash_values = iter(hash_material[2 * desired_length:])
 
     for char_set in categories_to_ensure:
-        if not char_set: # Skip if the character set itself is empty
-            continue
+        injection_position = next(hash_values) % desired_length
+        char_to_inject = char_set[next(hash_values) % len(char_set)]
 
-        if guarantee_hash_idx + 1 >= len(extended_hash):
-            extended_hash += base_hash.repeat(2)
-            if verbose:
-                console.print("[dim]  Dynamically extended hash for diversity injection.[/dim]")
+        password_buf[injection_position] = char_to_inject
+        if verbose:
+            injected = chr(char_to_inject) if ascii_sets else char_to_inject
+            console.print(f"[dim]  Injected '{injected}' for diversity at position {injection_position}.[/dim]")
 
-        pos_val = int(extended_hash[guarantee_hash_idx % len(extended_hash)], 16)
-        guarantee_hash_idx += 1
-        injection_position = pos_val % desired_length
+    return password_buf.decode("ascii") if ascii_sets else "".join(password_buf)
 
-        if guarantee_hash_idx + 1 >= len(extended_hash):
-            extended_hash += base_hash.repeat(2)
-        char_val = int(extended_hash[guarantee_hash_idx % len(extended_hash)], 16)
-        guarantee_hash_idx += 1
-        char_to_inject = char_set[char_val % len(char_set)]
+def _read_secret_inputs() -> tuple[str, str]:
+    """
+    Reads the Simple Password and Unique Key without echoing them.
+    Exits with an error if reading fails or either input is empty.
 
-        transformed_password_chars[injection_position] = char_to_inject
-        if verbose:
-            console.print(f"[dim]  Injected '{char_to_inject}' for diversity at position {injection_position}.[/dim]")
+    Returns:
+        tuple[str, str]: The Simple Password and the Unique Key.
+    """
+    try:
+        # getpass.getpass takes a string prompt, so Text.plain is used
+        simple_password = getpass.getpass(prompt=Text("Enter your Simple Password (e.g., 'mysecretphrase'): ", style="bold green").plain)
+        unique_key = getpass.getpass(prompt=Text("Enter your Unique Key (e.g., 'facebook', 'email!'): ", style="bold green").plain)
+    except Exception as e:
+        console.print(f"[bold red]Error reading input: {e}[/bold red]", file=sys.stderr)
+        sys.exit(1)
+
+    # Validate inputs are not empty
+    if not simple_password or not unique_key:
+        console.print("[bold red]Error: Both Simple Password and Unique Key are required to generate a password.[/bold red]", file=sys.stderr)
+        sys.exit(1)
 
-    return "".join(transformed_password_chars)
+    return simple_password, unique_key
+
+def _run_plain(args: argparse.Namespace):
+    """
+    Plain output path used when stdout is not a terminal (piped or redirected).
+
+    Skips rich and all decoration: prompts go to stderr / the terminal, and only
+    the generated password(s) are written to stdout, one per line. All other
+    messages (errors, verbose details, clipboard status) go to stderr.
+    """
+    global console
+    console = FallbackConsole(file=sys.stderr)
+
+    desired_length = args.length
+
+    # Prompt for length if not provided via CLI argument
+    if desired_length is None:
+        sys.stderr.write("Enter desired password length [16]: ")
+        sys.stderr.flush()
+        length_input_str = sys.stdin.readline().strip() or "16"
+        try:
+            desired_length = int(length_input_str)
+        except ValueError:
+            console.print("[bold red]Invalid input. Please enter a valid number.[/bold red]", file=sys.stderr)
+            sys.exit(1)
+
+    if desired_length <= 0:
+        console.print("[bold red]Error: Desired length must be a positive integer.[/bold red]", file=sys.stderr)
+        sys.exit(1)
+
+    simple_password, unique_key = _read_secret_inputs()
+
+    try:
+        active_char_sets = build_char_sets(
+            not args.no_upper,
+            not args.no_lower,
+            not args.no_numbers,
+            not args.no_symbols,
+            args.symbols_set
+        )
+        generated_password = generate_monkey_password(
+            simple_password,
+            unique_key,
+            desired_length,
+            active_char_sets,
+            args.verbose,
+            args.hash
+        )
+    except ValueError as e:
+        console.print(f"[bold red]Error during generation: {e}[/bold red]", file=sys.stderr)
+        sys.exit(1)
+
+    # The password is deterministic, so every requested copy is identical.
+    passwords = [generated_password] * args.count
+    sys.stdout.write("".join(password + "\n" for password in passwords))
+
+    if args.copy and passwords and not copy_to_clipboard("\n".join(dict.fromkeys(passwords))):
+        console.print("[bold yellow]Failed to copy password(s) to clipboard. Please copy manually.[/bold yellow]", file=sys.stderr)
 
 def main():
     """
@@ -401,6 +621,12 @@ def main():
         type=str,
         help="Provide a custom set of symbols (e.g., '!@#$'). Overrides default symbols."
     )
+    parser.add_argument(
+        "--hash",
+        choices=HASH_ALGORITHMS,
+        default="sha256",
+        help="Hash used to derive the password (default: sha256). 'shake256' uses a full hash byte per choice, so every\ncharacter of each set can appear and long passwords never repeat hash material,\nbut it produces different passwords than 'sha256' for the same inputs."
+    )
     parser.add_argument(
         "-v", "--verbose",
         action="store_true",
@@ -413,6 +639,14 @@ def main():
     )
     args = parser.parse_args()
 
+    # Scripted invocations (stdout piped or redirected) get the plain output path,
+    # which never loads rich or renders panels.
+    if not sys.stdout.isatty():
+        _run_plain(args)
+        return
+
+    _init_ui()
+
     # Welcome Panel
     console.print(Panel(
         "[bold green]Welcome to Monkey CLI Password Generator![/bold green]\n\n"
@@ -465,18 +699,7 @@ def main():
         box=MINIMAL if RICH_AVAILABLE else None
     ))
 
-    try:
-        # getpass.getpass takes a string prompt, so Text.plain is used
-        simple_password = getpass.getpass(prompt=Text("Enter your Simple Password (e.g., 'mysecretphrase'): ", style="bold green").plain)
-        unique_key = getpass.getpass(prompt=Text("Enter your Unique Key (e.g., 'facebook', 'email!'): ", style="bold green").plain)
-    except Exception as e:
-        console.print(f"[bold red]Error reading input: {e}[/bold red]", file=sys.stderr)
-        sys.exit(1)
-
-    # Validate inputs are not empty
-    if not simple_password or not unique_key:
-        console.print("[bold red]Error: Both Simple Password and Unique Key are required to generate a password.[/bold red]", file=sys.stderr)
-        sys.exit(1)
+    simple_password, unique_key = _read_secret_inputs()
 
     # Generation Options Summary
     console.print(Rule("[bold magenta]Generation Options[/bold magenta]", style="magenta"))
@@ -487,27 +710,45 @@ def main():
     if args.no_numbers: console.print("  [bold red]- Excluding numbers.[/bold red]")
     if args.no_symbols: console.print("  [bold red]- Excluding symbols.[/bold red]")
     if args.symbols_set: console.print(f"  [bold yellow]- Using custom symbols:[/bold yellow] '[cyan]{args.symbols_set}[/cyan]'")
+    if args.hash != "sha256": console.print(f"  [bold yellow]- Using hash:[/bold yellow] [cyan]{args.hash}[/cyan]")
     if args.copy: console.print("  [bold green]- Automatically copying to clipboard.[/bold green]")
     console.print(Rule(style="dim"))
 
 
+    # The character sets only depend on the options, so build them once for all passwords.
+    try:
+        active_char_sets = build_char_sets(
+            not args.no_upper,
+            not args.no_lower,
+            not args.no_numbers,
+            not args.no_symbols,
+            args.symbols_set
+        )
+    except ValueError as e:
+        console.print(f"[bold red]Error during generation: {e}[/bold red]")
+        sys.exit(1)
+
+    # Generation is deterministic, so every iteration yields the same password: compute
+    # it once and reuse it (with --verbose it is recomputed so each shows its details).
+    generated_password = None
+    # Passwords to copy are collected and sent to the clipboard in one go after the loop.
+    passwords_to_copy = []
+
     # Loop for generating multiple passwords
     for i in range(args.count):
         if args.count > 1:
             console.print(Rule(f"[bold blue]Password {i + 1} of {args.count}[/bold blue]", style="blue"))
 
         try:
-            generated_password = generate_monkey_password(
-                simple_password,
-                unique_key,
-                desired_length,
-                not args.no_upper,
-                not args.no_lower,
-                not args.no_numbers,
-                not args.no_symbols,
-                args.symbols_set,
-                args.verbose
-            )
+            if generated_password is None or args.verbose:
+                generated_password = generate_monkey_password(
+                    simple_password,
+                    unique_key,
+                    desired_length,
+                    active_char_sets,
+                    args.verbose,
+                    args.hash
+                )
 
             # Display Generated Password
             console.print(Panel(
@@ -525,12 +766,9 @@ def main():
                 for item in feedback:
                     console.print(Text(f"  - {item}"))
 
-            # Clipboard Copy
+            # Clipboard Copy (deferred until all passwords are generated)
             if args.copy:
-                if copy_to_clipboard(generated_password):
-                    console.print("[bold green]Password copied to clipboard![/bold green]")
-                else:
-                    console.print("[bold yellow]Failed to copy password to clipboard. Please copy manually.[/bold yellow]")
+                passwords_to_copy.append(generated_password)
             else:
                 console.print("[dim]Please copy and paste this password where needed. It is NOT stored.[/dim]")
 
@@ -545,6 +783,15 @@ def main():
                 console.print(Rule(style="red"))
             continue
 
+    # Clipboard Copy: a single clipboard call for the distinct generated password(s), one
+    # per line. Repeats of the same password are dropped so the clipboard holds exactly
+    # what should be pasted.
+    if passwords_to_copy:
+        if copy_to_clipboard("\n".join(dict.fromkeys(passwords_to_copy))):
+            console.print("[bold green]Password(s) copied to clipboard![/bold green]")
+        else:
+            console.print("[bold yellow]Failed to copy password(s) to clipboard. Please copy manually.[/bold yellow]")
+
     # Final Security Note
     console.print(Rule(style="dim"))
     console.print(Panel(
@@ -0,0 +1,61 @@
+"""
+Golden-vector tests for the Monkey password generator.
+
+Passwords are regenerated from the same inputs rather than stored, so the
+output for a given set of inputs must never change. These vectors were
+produced by the original implementation of the algorithm.
+"""
+
+import unittest
+
+import monkey
+
+
+# (simple_password, unique_key, length, (upper, lower, numbers, symbols), custom_symbols, expected)
+GOLDEN_VECTORS = [
+    ("hunter2", "facebook", 16, (True, True, True, True), None, "*BnK3LoAn@b74FfC"),
+    ("hunter2", "facebook", 4, (True, True, True, True), None, "*B3K"),
+    ("hunter2", "facebook", 70, (True, True, True, True), None,
+     "*BnK3LoAn@b74FfClLeF^MDh2CDC]7e=*BnK3LoAn@b74FfClLeF^MDh2CDC]7e=*BnK3L"),
+    ("mysecretphrase", "email!", 12, (False, True, True, False), None, "eic9l2j38730"),
+    ("mysecretphrase", "email!", 8, (True, False, False, False), None, "EICJLCJD"),
+    ("mysecretphrase", "email!", 24, (True, True, True, True), "!@#$", "482@Lc9di$@a#A!M2$Ia@g0J"),
+    ("a", "b", 3, (True, True, True, True), None, "mO0"),
+    # Non-ASCII custom symbols, including cased and numeric ones that also count
+    # towards the uppercase / lowercase / digit diversity checks.
+    ("hunter2", "site", 12, (True, True, True, True), "€£", "e£€676P£5€o€"),
+    ("hunter2", "site", 4, (True, True, True, True), "Ω", "eΩΩ6"),
+    ("hunter2", "site", 6, (True, False, True, True), "ß", "EHGGß6"),
+    ("hunter2", "site", 5, (False, True, False, True), "é²", "é²égh"),
+]
+
+# Same layout as GOLDEN_VECTORS, generated with hash_algorithm="shake256".
+SHAKE256_GOLDEN_VECTORS = [
+    ("hunter2", "facebook", 16, (True, True, True, True), None, "l*!+TGc928$*Ba3q"),
+    ("hunter2", "facebook", 70, (True, True, True, True), None,
+     "l*!+TGc928$*Ba3qv1Gt94MXVRxHaSL%gMgn%PaV3tkyF^]u3ADIm4p_066JodPeojl4/."),
+    ("hunter2", "site", 8, (True, True, True, True), "Ω€", "4ΩiQiT€€"),
+]
+
+
+def _generate(simple_password, unique_key, length, flags, custom_symbols, hash_algorithm="sha256"):
+    active_char_sets = monkey.build_char_sets(*flags, custom_symbols)
+    return monkey.generate_monkey_password(simple_password, unique_key, length, active_char_sets, False,
+                                           hash_algorithm)
+
+
+class GoldenVectorTest(unittest.TestCase):
+    def test_golden_vectors(self):
+        for simple_password, unique_key, length, flags, custom_symbols, expected in GOLDEN_VECTORS:
+            with self.subTest(unique_key=unique_key, length=length, flags=flags, custom_symbols=custom_symbols):
+                self.assertEqual(_generate(simple_password, unique_key, length, flags, custom_symbols), expected)
+
+    def test_shake256_golden_vectors(self):
+        for simple_password, unique_key, length, flags, custom_symbols, expected in SHAKE256_GOLDEN_VECTORS:
+            with self.subTest(unique_key=unique_key, length=length, flags=flags, custom_symbols=custom_symbols):
+                self.assertEqual(_generate(simple_password, unique_key, length, flags, custom_symbols, "shake256"),
+                                 expected)
+
+
+if __name__ == "__main__":
+    unittest.main()